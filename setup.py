@@ -8,6 +8,7 @@ setup(
     author="Charles Titus",
     author_email="charles.titus@nist.gov",
     install_requires=["bluesky",],
+    extras_require={"msgpack": ["msgpack"], "orjson": ["orjson"]},
     name="sst_tes",
     entry_points={
         'databroker.handlers': [
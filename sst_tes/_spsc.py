@@ -0,0 +1,65 @@
+import os
+
+
+class SPSCRing:
+    """
+    A bounded FIFO for handing items from exactly one producer thread to
+    exactly one consumer thread.
+
+    The producer only ever writes the tail index and the consumer only the head,
+    and CPython makes each of those stores atomic, so neither side takes a lock.
+    A consumer that finds the ring empty sleeps on an eventfd (a pipe where
+    eventfd is unavailable), and the producer only signals it when it is asleep.
+    """
+    def __init__(self, size=64):
+        if size < 1 or size & (size - 1):
+            raise ValueError(f"Ring size must be a power of two, not {size}")
+        self._mask = size - 1
+        self._slots = [None] * size
+        self._head = 0
+        self._tail = 0
+        self._sleeping = False
+        if hasattr(os, "eventfd"):
+            self._rfd = self._wfd = os.eventfd(0)
+        else:
+            self._rfd, self._wfd = os.pipe()
+
+    def try_push(self, item):
+        """
+        Add item to the ring, returning False instead if it is full
+        """
+        tail = self._tail
+        if tail - self._head > self._mask:
+            return False
+        self._slots[tail & self._mask] = item
+        self._tail = tail + 1
+        if self._sleeping:
+            os.write(self._wfd, (1).to_bytes(8, "little"))
+        return True
+
+    def pop(self):
+        """
+        Remove and return the oldest item, waiting for one if the ring is empty
+        """
+        while True:
+            head = self._head
+            if head != self._tail:
+                i = head & self._mask
+                item = self._slots[i]
+                self._slots[i] = None
+                self._head = head + 1
+                return item
+            self._sleeping = True
+            # Check again now that the producer can see we are going to sleep,
+            # so that a push in between can't be missed
+            if self._head == self._tail:
+                os.read(self._rfd, 8)
+            self._sleeping = False
+
+    def close(self):
+        """
+        Release the wakeup file descriptors, once neither side uses the ring
+        """
+        os.close(self._rfd)
+        if self._wfd != self._rfd:
+            os.close(self._wfd)
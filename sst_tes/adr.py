@@ -1,9 +1,13 @@
 from ophyd import Device, Component, Kind, EpicsSignal, EpicsSignalRO
-from .tes_signals import RPCSignalRO, RPCSignalPair
+from .tes_signals import RPCSignalRO, RPCSignalPair, RPCBatchReadMixin
 from .rpc import RPCInterface
 
 
-class ADR(Device, RPCInterface):
+class ADR(RPCBatchReadMixin, Device, RPCInterface):
+    """
+    ADR controlled over RPC. A read fetches all of the temperatures and
+    status values in one get_many round trip, where the server supports it.
+    """
     state = Component(RPCSignalRO, method='get_state_label')
     temperature_sp = Component(RPCSignalPair, get_method='get_temp_sp_k', set_method='set_temp_sp_k')
     t50mk = Component(RPCSignalRO, method='get_temp_k')
@@ -38,16 +38,7 @@ class FlyableTES(TESBase):
             print("Exiting _scan thread")
 
     def kickoff(self):
-        if self.file_mode == "start_stop":
-            self._file_start()
-
-        if self.state.get() == "no_file":
-            self._file_start()
-
-        if self.cal_flag.get():
-            self._calibration_start()
-        else:
-            self._scan_start()
+        self._begin_scan()
         if self.verbose:
             print("Kicking off TES")
         self._data_index = itertools.count()
@@ -1,4 +1,5 @@
 from ophyd import DeviceStatus, Component as Cpt, FormattedComponent as FCpt
+from ophyd.status import AndStatus
 import itertools
 from .tes import TESBase
 from sst_base.detectors.mca import EpicsMCABase
@@ -26,7 +27,12 @@ class TESMCA(TESBase):
     def trigger(self):
         sts1 = super().trigger()
         sts2 = self.mca.trigger()
-        return sts1 & sts2
+        # No need to wait on a status that has already succeeded
+        if sts1.done and sts1.success:
+            return sts2
+        if sts2.done and sts2.success:
+            return sts1
+        return AndStatus(sts1, sts2)
 
     def stage(self):
         if self.verbose:
@@ -34,26 +40,14 @@ class TESMCA(TESBase):
         self._data_index = itertools.count()
         self._completion_status = DeviceStatus(self)
 
-        if self.file_mode == "start_stop":
-            self._file_start()
-
-        if self.state.get() == "no_file":
-            self._file_start()
-            # raise ValueError(f"{self.name} has no file open, cannot stage.")
-
-        if self.cal_flag.get():
-            self._calibration_start()
-        else:
-            self._scan_start()
+        self._begin_scan()
 
         return super().stage()
 
     def unstage(self):
         if self.verbose:
             print("Complete acquisition of TES")
-        self._scan_end()
-        if self.file_mode == "start_stop":
-            self._file_end()
+        self._finish_scan()
         self._log = {}
         self._data_index = None
         return super().unstage()
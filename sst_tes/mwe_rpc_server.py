@@ -22,6 +22,13 @@ def call_method_from_data(data, dispatch, no_traceback_error_types):
     except Exception as e:
         return None, None, None, None, None, f"JSON Parse Exception: {e}"
     _id = d.get("id", -1)
+    if "mid" in d.keys():
+        # Ids handed out by register_methods index the names it recorded
+        names = getattr(dispatch.get("register_methods"), "names", None)
+        try:
+            d["method"] = names[d["mid"]]
+        except (IndexError, TypeError):
+            return _id, None, None, None, None, f"mid {d['mid']} is not a registered method id"
     if "method" not in d.keys():
         return _id, None, None, None, None, f"method key does not exist"
     method_name = d["method"]
@@ -101,6 +108,49 @@ def make_attribute_accessor(x, a):
 
     return get_set_attr
 
+def make_get_many(dispatch):
+    def get_many(methods):
+        return {m: dispatch[m]() for m in methods}
+
+    return get_many
+
+def make_batch(dispatch):
+    def batch(calls):
+        """
+        Run a list of {"method", "params", "kwargs", "input_from"} calls in order,
+        stopping at the first failure. "sleep" is available as a method.
+        """
+        results = []
+        for call in calls:
+            method_name = call["method"]
+            args = list(call.get("params", []))
+            kwargs = call.get("kwargs", {})
+            if "input_from" in call:
+                args.insert(0, results[call["input_from"]]["response"])
+            try:
+                if method_name == "sleep":
+                    method = time.sleep
+                else:
+                    method = dispatch[method_name]
+                results.append({"response": method(*args, **kwargs), "success": True})
+            except Exception as e:
+                results.append({"response": f"Calling Exception: method={method_name}: {e}",
+                                "success": False})
+                break
+        return results
+
+    return batch
+
+def make_register_methods(dispatch):
+    def register_methods(methods):
+        if register_methods.names is None:
+            register_methods.names = list(dispatch.keys())
+        ids = {m: i for i, m in enumerate(register_methods.names)}
+        return {m: ids[m] for m in methods if m in ids}
+
+    register_methods.names = None
+    return register_methods
+
 def get_dispatch_from(x):
     d = collections.OrderedDict()
     for m in sorted(dir(x)):
@@ -109,6 +159,9 @@ def get_dispatch_from(x):
                 d[m] = getattr(x, m)
             else:
                 d[m] = make_attribute_accessor(x, m)
+    d["get_many"] = make_get_many(d)
+    d["batch"] = make_batch(d)
+    d["register_methods"] = make_register_methods(d)
     return d
 
 def start(address, port, dispatch, verbose, log_file, no_traceback_error_types):
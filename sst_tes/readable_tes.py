@@ -15,6 +15,11 @@ from sst_base.detectors.mca import EpicsMCABase
 class TES(TESBase):
     _fast_read = True
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Prepared roi_get_counts calls, keyed by the _fast_read they were made for
+        self._roi_get_counts = {}
+
     @property
     def hints(self):
         return self._hints
@@ -22,26 +27,27 @@ class TES(TESBase):
     def describe(self):
         d = super().describe()
         if self.write_off:
-            for k in self.rois:
-                key = self.name + "_" + k
-                d[key] = {"dtype": "number", "shape": [], "source": key,
-                          "llim": self.rois[k][0], "ulim": self.rois[k][1]}
+            d.update(self._roi_describe)
         return d
 
     def read(self):
         d = super().read()
         if self.write_off:
-            msg = self.rpc.roi_get_counts(fast=self._fast_read)
+            fast = self._fast_read
+            get_counts = self._roi_get_counts.get(fast)
+            if get_counts is None:
+                get_counts = self._roi_get_counts[fast] = self.rpc.prepare(
+                    "roi_get_counts", fast=fast
+                )
+            msg = get_counts()
+            t = self.last_time
             if msg['success']:
                 rois = msg['response']
-                for k in self.rois:
-                    key = self.name + "_" + k
-                    val = rois[k]
-                    d[key] = {"value": val, "timestamp": self.last_time}
+                d.update({key: {"value": rois[k], "timestamp": t}
+                          for k, key in self._roi_keys.items()})
             else:
-                for k in self.rois:
-                    key = self.name + "_" + k
-                    d[key] = {"value": 0, "timestamp": self.last_time}
+                d.update({key: {"value": 0, "timestamp": t}
+                          for key in self._roi_keys.values()})
         return d
 
     def stage(self):
@@ -49,28 +55,15 @@ class TES(TESBase):
             print("Staging TES")
         self._data_index = itertools.count()
         self._completion_status = DeviceStatus(self)
-        self._external_devices = [dev for _, dev in self._get_components_of_kind(Kind.normal)
-                                  if hasattr(dev, 'collect_asset_docs')]
-
-        if self.file_mode == "start_stop":
-            self._file_start()
-
-        if self.state.get() == "no_file":
-            self._file_start()
-            # raise ValueError(f"{self.name} has no file open, cannot stage.")
+        self._external_devices = self._external_devices_cached
 
-        if self.cal_flag.get():
-            self._calibration_start()
-        else:
-            self._scan_start()
+        self._begin_scan()
 
         return super().stage()
 
     def unstage(self):
         if self.verbose: print("Complete acquisition of TES")
-        self._scan_end()
-        if self.file_mode == "start_stop":
-            self._file_end()
+        self._finish_scan()
         self._log = {}
         self._data_index = None
         self._external_devices = None
@@ -85,9 +78,9 @@ class SIMTES(TES):
 
     def _acquire(self, status, i):
         t1 = self._motor.read()[self._motor_field]['value']
-        t2 = t1 + self.acquire_time.get()
+        t2 = t1 + self._acquire_time
         self.rpc.scan_point_start(i, t1)
-        ttime.sleep(self.acquire_time.get())
+        ttime.sleep(self._acquire_time)
         self.rpc.scan_point_end(t2)
         if self._save_roi:
             self.rpc.roi_save_counts()
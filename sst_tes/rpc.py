@@ -1,21 +1,72 @@
 from ophyd.ophydobj import OphydObject
+from collections import deque
+from concurrent.futures import Future
+import itertools
 import json
+import logging
+import selectors
 import socket
+import struct
+import threading
+import time
 import zmq
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj):
+        # Unlike json, orjson sends NaN and infinities as null. Anything else
+        # it refuses that json accepts is left to json.
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return json.dumps(obj).encode()
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Only available on Linux
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+
 
 class RPCException(Exception):
     pass
 
 
 class RPCInterface(OphydObject):
-    def __init__(self, *args, address="", port=None, client='socket', **kwargs):
+    rpc_sub = None
+    rpc_push = None
+
+    def __init__(self, *args, address="", port=None, client='socket', sub_port=None,
+                 push_port=None, busy_poll=False, persistent=False, **kwargs):
         super().__init__(*args, **kwargs)
+        if sub_port is not None:
+            self.rpc_sub = ZMQSubscriber(address, sub_port)
+        if push_port is not None:
+            self.rpc_push = ZMQPusher(address, push_port)
         if port is not None:
             if client == 'zmqreq':
-                self.rpc = ZMQREQClient(address, port)
+                self.rpc = ZMQREQClient(address, port, busy_poll=busy_poll)
+            elif client == 'zmqdealer':
+                self.rpc = ZMQDEALERClient(address, port)
             elif client == 'socket':
-                self.rpc = SocketClient(address, port)
+                self.rpc = SocketClient(address, port, busy_poll=busy_poll, persistent=persistent)
+            elif client == 'reactor':
+                self.rpc = ReactorSocketClient(address, port)
             else:
                 raise ValueError(f"client type {client} not understood")
                 
@@ -26,78 +77,770 @@ class RPCInterface(OphydObject):
         return f'RPC:{self.rpc.address}:{self.rpc.port}'
         
     def _get_comm_function(self):
-        if hasattr(self, "rpc"):
-            return self.rpc
-        else:
-            parent = self.parent
-            return self._get_comm_tail(parent)
-        
-    def _get_comm_tail(self, parent):
-        if hasattr(parent, "rpc"):
-            return parent.rpc
-        elif hasattr(parent, "parent"):
-            if parent is None:
-                raise IOError("No parent has an RPC Client")
-            return self._get_comm_tail(parent.parent)
-        else:
-            raise IOError("No parent has an RPC Client")
+        """
+        Walk up from self to the nearest object with an RPC client, and keep
+        it on self so that later lookups don't repeat the walk
+        """
+        obj = self
+        while obj is not None:
+            rpc = getattr(obj, "rpc", None)
+            if rpc is not None:
+                self.rpc = rpc
+                return rpc
+            obj = getattr(obj, "parent", None)
+        raise IOError("No parent has an RPC Client")
 
 
 class JSONClientBase:
+    protocol = "json"
+    # Method ids are only safe where they can't outlive the server process
+    # that handed them out, see SocketClient
+    supports_method_ids = False
+
     def __init__(self, address, port):
         self.address = address
         self.port = port
+        self._unsupported = set()
+        self._templates = {}
+        self.method_ids = {}
+        self._id_methods = None
+        # Bumped whenever method_ids changes, so cached encodings can tell
+        # whether they are still current
+        self._ids_version = 0
 
-    def formatMsg(self, method, *params, **kwargs):
-        msg = {"method": method}
+    def _set_method_ids(self, ids):
+        self.method_ids = ids
+        self._ids_version += 1
+        self._templates.clear()
+
+    def register_methods(self, methods):
+        """
+        Have methods sent by numeric id rather than by name. The ids are
+        requested from the server whenever a connection is opened, so this
+        should be called before the first call. Clients without id support
+        ignore it.
+        """
+        if self.supports_method_ids:
+            self._id_methods = list(methods)
+
+    def _encodeMsg(self, method, params, kwargs):
+        mid = self.method_ids.get(method)
+        if mid is None:
+            msg = {"method": method}
+        else:
+            msg = {"mid": mid}
         if params is not None and params != []:
             msg["params"] = params
         if kwargs is not None and kwargs != {}:
             msg["kwargs"] = kwargs
-        return json.dumps(msg).encode()
+        if self.protocol == "msgpack":
+            payload = msgpack.packb(msg)
+            return struct.pack(">I", len(payload)) + payload
+        return _dumps(msg)
+
+    def formatMsg(self, method, *params, **kwargs):
+        if isinstance(method, PreparedCall):
+            key = (self.protocol, self._ids_version)
+            msg = method._encoded.get(key)
+            if msg is None:
+                msg = method._encoded[key] = self._encodeMsg(
+                    method.method, method.params, method.kwargs
+                )
+            return msg
+        if isinstance(method, PartialCall):
+            if self.protocol != "json":
+                return self._encodeMsg(method.method, params, method.kwargs)
+            # Splice the per-call arguments onto the already encoded rest of
+            # the message
+            prefix = method._prefix.get(self._ids_version)
+            if prefix is None:
+                prefix = self._encodeMsg(method.method, None, method.kwargs)[:-1] + b', "params": '
+                method._prefix[self._ids_version] = prefix
+            return prefix + _dumps(params) + b"}"
+        if not params and not kwargs:
+            # Calls without arguments always encode the same way, so reuse the bytes
+            key = (method, self.protocol, self._ids_version)
+            msg = self._templates.get(key)
+            if msg is None:
+                msg = self._templates[key] = self._encodeMsg(method, params, kwargs)
+            return msg
+        return self._encodeMsg(method, params, kwargs)
+
+    def prepare(self, method, *params, **kwargs):
+        """
+        Return a PreparedCall for method with fixed arguments
+        """
+        return PreparedCall(self, method, params, kwargs)
+
+    def partial(self, method, **kwargs):
+        """
+        Return a PartialCall for method with fixed keyword arguments
+        """
+        return PartialCall(self, method, kwargs)
+
+    def batch(self):
+        """
+        Return an RPCBatch for sending several calls in one request
+        """
+        return RPCBatch(self)
+
+    def call_if_supported(self, method, *params, extra_timeout=0, **kwargs):
+        """
+        Call method, returning None instead if the server does not implement it.
+        Missing methods are remembered so that they are only tried once.
+        extra_timeout is passed on to sendrcv.
+        """
+        if method in self._unsupported:
+            return None
+        msg = self.sendrcv(method, *params, extra_timeout=extra_timeout, **kwargs)
+        if not msg["success"] and str(msg["response"]).startswith(f"Method '{method}' does not"):
+            self._unsupported.add(method)
+            return None
+        return msg
 
     def __getattr__(self, attr):
         def _method(*params, **kwargs):
             return self.sendrcv(attr, *params, **kwargs)
         return _method
 
+class RPCBatch:
+    """
+    Collects RPC calls to send to the server as one "batch" request, which the
+    server runs in order, stopping at the first failure. A call may take the
+    result of an earlier call in the batch as its first argument by giving
+    that call's index as input_from. Besides its own methods, the server
+    provides "sleep" for waiting between calls.
+
+    Use as a context manager, which submits on exit, or call submit directly.
+    responses is left as None if the server does not support batches, in
+    which case the caller should make the calls itself. The server stops at
+    the first failed call but still reports the batch as a success, so
+    callers should check each response. The time spent in "sleep" calls is
+    added to the reply timeout.
+    """
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+        self.responses = None
+        self._sleep_time = 0
+
+    def add(self, method, *params, input_from=None, **kwargs):
+        call = {"method": method}
+        if params:
+            call["params"] = params
+        if kwargs:
+            call["kwargs"] = kwargs
+        if input_from is not None:
+            call["input_from"] = input_from
+        if method == "sleep" and params and isinstance(params[0], (int, float)):
+            self._sleep_time += params[0]
+        self.calls.append(call)
+        return len(self.calls) - 1
+
+    def submit(self):
+        msg = self.client.call_if_supported("batch", self.calls, extra_timeout=self._sleep_time)
+        if msg is None:
+            return None
+        if not msg["success"]:
+            raise RPCException(f"Batch failed with message {msg['response']}")
+        self.responses = msg["response"]
+        return self.responses
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.submit()
+
+
+class PreparedCall:
+    """
+    An RPC call with fixed arguments, made by calling it with no arguments.
+    Its encoded message is kept and reused, rather than re-encoded every call.
+    """
+    def __init__(self, client, method, params, kwargs):
+        self.client = client
+        self.method = method
+        self.params = params
+        self.kwargs = kwargs
+        self._encoded = {}
+
+    def __call__(self):
+        return self.client.sendrcv(self)
+
+
+class PartialCall:
+    """
+    An RPC call with fixed keyword arguments, made by calling it with its
+    positional arguments. For JSON, everything but the positional arguments is
+    encoded once and reused.
+    """
+    def __init__(self, client, method, kwargs):
+        self.client = client
+        self.method = method
+        self.kwargs = kwargs
+        self._prefix = {}
+
+    def __call__(self, *params):
+        return self.client.sendrcv(self, *params)
+
+
 class SocketClient(JSONClientBase):
     """
     JSON RPC over a built-in TCP Socket
+
+    By default a connection is opened for each call and closed after the
+    reply, because the bundled server serves one connection at a time until
+    the client closes it. With persistent=True one connection is opened
+    lazily and reused for every call, which saves the connect on each call,
+    but the server must then handle concurrent connections if more than one
+    client talks to it. If the server has dropped a persistent connection, it
+    is re-established once and the call retried.
+
+    Waiting for a connection or a reply gives up with a TimeoutError after
+    timeout seconds. The default of None waits forever, since some calls
+    (make_projectors, file_end with rsync) can run for a long time.
+
+    If msgpack is installed, each new persistent connection first asks the
+    server to set_protocol("msgpack"). Servers that agree switch to
+    length-prefixed msgpack messages; servers that don't keep speaking plain
+    JSON.
+
+    With busy_poll, the reply is first waited for by spinning on a non-blocking
+    recv for busy_poll_time seconds, which avoids a scheduler wakeup for fast
+    replies at the cost of burning CPU while spinning.
     """
-    def sendrcv(self, method, *params, **kwargs):
-        msg = self.formatMsg(method, *params, **kwargs)
-        s = socket.socket()
-        s.connect((self.address, self.port))
-        s.send(msg)
-        m = json.loads(s.recv(1024).decode())
-        s.close()
+    busy_poll_time = 200e-6
+    # Socket buffer sizes in bytes, None keeps the OS default
+    sndbuf = None
+    rcvbuf = None
+
+    def __init__(self, address, port, busy_poll=False, use_msgpack=True,
+                 persistent=False, timeout=None):
+        super().__init__(address, port)
+        self.busy_poll = busy_poll
+        self.persistent = persistent
+        self.timeout = timeout
+        # A connection per call would pay for the negotiation on every call
+        self.use_msgpack = use_msgpack and persistent and msgpack is not None
+        self._sock = None
+        self._lock = threading.Lock()
+
+    def _ensure_conn(self):
+        if self._sock is None:
+            s = socket.create_connection((self.address, self.port), timeout=self.timeout)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.sndbuf is not None:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+            if self.rcvbuf is not None:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+            self._sock = s
+            self.protocol = "json"
+            if self.method_ids:
+                # The server may have restarted with different ids, so go back
+                # to names until they are registered again below
+                self._set_method_ids({})
+            if self.use_msgpack:
+                self._negotiate(s)
+            if self._id_methods:
+                self._request_ids(s)
+        return self._sock
+
+    @property
+    def supports_method_ids(self):
+        # Ids are only used on a persistent connection, which a server restart
+        # always breaks, and are requested again on every new connection
+        return self.persistent
+
+    def _request_ids(self, s):
+        s.sendall(self.formatMsg("register_methods", self._id_methods))
+        msg = self._recv_reply(s)
+        if msg["success"]:
+            self._set_method_ids(msg["response"])
+        else:
+            # The server has no ids to give, no need to ask again on reconnect
+            self._id_methods = None
+
+    def _negotiate(self, s):
+        s.sendall(self.formatMsg("set_protocol", "msgpack"))
+        if self._recv_reply(s)["success"]:
+            self.protocol = "msgpack"
+        else:
+            # The server only speaks JSON, no need to ask again on reconnect
+            self.use_msgpack = False
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _spin_recv(self, s, n):
+        timeout = s.gettimeout()
+        s.setblocking(False)
+        try:
+            deadline = time.perf_counter() + self.busy_poll_time
+            while time.perf_counter() < deadline:
+                try:
+                    return s.recv(n)
+                except BlockingIOError:
+                    pass
+        finally:
+            s.settimeout(timeout)
+        return s.recv(n)
+
+    def _recv(self, s, n, first=False):
+        if _TCP_QUICKACK is not None:
+            # Linux clears quickack after each ACK, so it has to be re-armed
+            # before every read to keep delayed ACKs off our replies
+            s.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+        if first and self.busy_poll:
+            chunk = self._spin_recv(s, n)
+        else:
+            chunk = s.recv(n)
+        if not chunk:
+            raise ConnectionResetError(f"{self.address}:{self.port} closed the connection")
+        return chunk
+
+    def _decode_reply(self, buf):
+        """
+        Return the reply held in buf, or None if it is not complete yet
+        """
+        if self.protocol == "msgpack":
+            if len(buf) < 4:
+                return None
+            (n,) = struct.unpack_from(">I", buf)
+            if len(buf) < 4 + n:
+                return None
+            return msgpack.unpackb(buf[4:4 + n], raw=False)
+        try:
+            # The server sends exactly one document per reply, so anything
+            # that doesn't parse is a reply that hasn't fully arrived yet
+            return _loads(buf)
+        except ValueError:
+            return None
+
+    def _recv_reply(self, s):
+        # Keep reading until we hold one complete reply rather than trusting a
+        # single recv to return it all. Only one request is ever outstanding, so
+        # a msgpack reply's header and body can be read together, which takes
+        # one recv instead of two for the usual small reply.
+        buf = self._recv(s, 4096, first=True)
+        m = self._decode_reply(buf)
+        while m is None:
+            buf += self._recv(s, 4096)
+            m = self._decode_reply(buf)
         return m
 
+    def _exchange(self, method, params, kwargs, extra_timeout):
+        s = self._ensure_conn()
+        if self.timeout is not None:
+            s.settimeout(self.timeout + extra_timeout)
+        s.sendall(self.formatMsg(method, *params, **kwargs))
+        reply = self._recv_reply(s)
+        if not self.persistent:
+            self.close()
+        return reply
+
+    def sendrcv(self, method, *params, extra_timeout=0, **kwargs):
+        """
+        Call method on the server and return its reply. extra_timeout is added
+        to the client's timeout for this call, for methods that take a known
+        time on the server before replying.
+        """
+        with self._lock:
+            # Only a reused connection may have been dropped by the server while
+            # idle. A reset on a fresh one may come after the server ran the
+            # call, so it is not sent again.
+            reused = self._sock is not None
+            try:
+                try:
+                    return self._exchange(method, params, kwargs, extra_timeout)
+                except (ConnectionResetError, BrokenPipeError):
+                    if not reused:
+                        raise
+                    self.close()
+                    return self._exchange(method, params, kwargs, extra_timeout)
+            except BaseException:
+                self.close()
+                raise
+
+class ReactorSocketClient(SocketClient):
+    """
+    SocketClient whose traffic is carried by the shared _RPCReactor thread
+    rather than by the calling thread. Callers wait on a Future, so any number
+    of clients (and threads) can have calls outstanding without each one
+    blocking in its own recv. Connecting and protocol negotiation still happen
+    in the caller; busy_poll does not apply. Connections are always
+    persistent. Like the ZMQ clients, a call times out after 5 seconds by
+    default; pass extra_timeout for calls known to take longer.
+    """
+    def __init__(self, address, port, timeout=5.0, **kwargs):
+        super().__init__(address, port, persistent=True, timeout=timeout, **kwargs)
+
+    def _connect(self):
+        with self._lock:
+            if self._sock is not None and self._sock.fileno() == -1:
+                # The reactor already dropped this connection after an error
+                self._sock = None
+            s = self._ensure_conn()
+            s.setblocking(False)
+            return s
+
+    def close(self):
+        with self._lock:
+            if self._sock is not None:
+                _get_reactor().discard(self._sock)
+                self._sock = None
+
+    def _exchange(self, method, params, kwargs, extra_timeout):
+        s = self._connect()
+        msg = self.formatMsg(method, *params, **kwargs)
+        timeout = self.timeout
+        if timeout is not None:
+            timeout += extra_timeout
+        return _get_reactor().submit(self, s, msg).result(timeout)
+
+    def sendrcv(self, method, *params, extra_timeout=0, **kwargs):
+        reused = self._sock is not None
+        try:
+            try:
+                return self._exchange(method, params, kwargs, extra_timeout)
+            except (ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                self.close()
+                return self._exchange(method, params, kwargs, extra_timeout)
+        except BaseException:
+            self.close()
+            raise
+
+
+class _ReactorConn:
+    def __init__(self, client, sock):
+        self.client = client
+        self.sock = sock
+        self.waiting = deque()
+        self.current = None
+        self.outbuf = b""
+        self.inbuf = b""
+
+
+class _RPCReactor:
+    """
+    A single thread that owns the I/O of every ReactorSocketClient connection.
+    A selector reports which sockets are ready, requests are written and replies
+    read as they become possible, and each reply completes its caller's Future.
+    The servers answer one request at a time per connection, so further
+    requests on a busy connection wait their turn.
+    """
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._conns = {}
+        self._calls = deque()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _call_soon(self, fn, *args):
+        self._calls.append((fn, args))
+        self._wake_w.send(b"\0")
+
+    def submit(self, client, sock, msg):
+        fut = Future()
+        self._call_soon(self._start, client, sock, msg, fut)
+        return fut
+
+    def discard(self, sock):
+        self._call_soon(self._drop, sock, ConnectionResetError("Connection discarded"))
+
+    def _run(self):
+        while True:
+            for key, events in self._selector.select():
+                if key.data is None:
+                    self._wake_r.recv(4096)
+                    while self._calls:
+                        fn, args = self._calls.popleft()
+                        # This thread serves every connection in the process,
+                        # so nothing may be allowed to end it
+                        try:
+                            fn(*args)
+                        except Exception:
+                            logger.exception("RPC reactor call %r failed", fn)
+                else:
+                    self._handle(key.data, events)
+
+    def _start(self, client, sock, msg, fut):
+        if sock.fileno() == -1:
+            fut.set_exception(ConnectionResetError("Connection discarded"))
+            return
+        try:
+            conn = self._conns.get(sock)
+            if conn is None:
+                conn = self._conns[sock] = _ReactorConn(client, sock)
+                self._selector.register(sock, selectors.EVENT_READ, conn)
+            conn.waiting.append((msg, fut))
+            self._send_next(conn)
+        except Exception as e:
+            if not fut.done():
+                fut.set_exception(e)
+            self._drop(sock, e)
+
+    def _send_next(self, conn):
+        if conn.current is None and conn.waiting:
+            conn.outbuf, conn.current = conn.waiting.popleft()
+            self._selector.modify(conn.sock, selectors.EVENT_READ | selectors.EVENT_WRITE, conn)
+
+    def _handle(self, conn, events):
+        try:
+            if events & selectors.EVENT_WRITE:
+                n = conn.sock.send(conn.outbuf)
+                conn.outbuf = conn.outbuf[n:]
+                if not conn.outbuf:
+                    self._selector.modify(conn.sock, selectors.EVENT_READ, conn)
+            if events & selectors.EVENT_READ:
+                chunk = conn.sock.recv(4096)
+                if not chunk:
+                    raise ConnectionResetError(f"{conn.client.address}:{conn.client.port} closed the connection")
+                conn.inbuf += chunk
+                reply = conn.client._decode_reply(conn.inbuf)
+                if reply is not None and conn.current is not None:
+                    fut, conn.current = conn.current, None
+                    conn.inbuf = b""
+                    fut.set_result(reply)
+                    self._send_next(conn)
+        except BlockingIOError:
+            pass
+        except Exception as e:
+            # Includes replies that fail to decode: only this connection and
+            # its callers are affected
+            self._drop(conn.sock, e)
+
+    def _drop(self, sock, exc):
+        conn = self._conns.pop(sock, None)
+        if conn is not None:
+            try:
+                self._selector.unregister(sock)
+            except (KeyError, ValueError):
+                # Never got as far as being registered
+                pass
+            for fut in [conn.current] + [f for _, f in conn.waiting]:
+                if fut is not None and not fut.done():
+                    fut.set_exception(exc)
+        sock.close()
+
+
+_reactor = None
+_reactor_lock = threading.Lock()
+
+
+def _get_reactor():
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = _RPCReactor()
+        return _reactor
+
+
 class ZMQREQClient(JSONClientBase):
     """
     JSON RPC over a ZMQ Req socket
+
+    The socket is created on first use and kept for later calls. A REQ socket
+    that missed its reply cannot send again, so it is discarded on timeout.
+
+    With busy_poll, the socket is polled without blocking for busy_poll_time
+    seconds before falling back to a blocking poll.
+    """
+    busy_poll_time = 200e-6
+
+    def __init__(self, address, port, timeout=5000, busy_poll=False):
+        super().__init__(address, port)
+        self.ctx = zmq.Context.instance()
+        self.addrstr = f"tcp://{address}:{port}"
+        self.timeout = timeout
+        self.busy_poll = busy_poll
+        self._sock = None
+        self._lock = threading.Lock()
+
+    def _ensure_conn(self):
+        if self._sock is None:
+            s = self.ctx.socket(zmq.REQ)
+            s.setsockopt(zmq.LINGER, 0)
+            s.connect(self.addrstr)
+            self._sock = s
+        return self._sock
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _poll(self, s, timeout):
+        if self.busy_poll:
+            deadline = time.perf_counter() + self.busy_poll_time
+            while time.perf_counter() < deadline:
+                if (s.poll(0) & zmq.POLLIN) != 0:
+                    return True
+        return (s.poll(timeout) & zmq.POLLIN) != 0
+
+    def sendrcv(self, method, *params, extra_timeout=0, **kwargs):
+        msg = self.formatMsg(method, *params, **kwargs)
+        # timeout is in ms, extra_timeout in seconds like everywhere else
+        timeout = self.timeout + extra_timeout * 1000
+        with self._lock:
+            try:
+                s = self._ensure_conn()
+                s.send(msg)
+                # https://zguide.zeromq.org/docs/chapter4/
+                # Not implementing retries because it is unlikely to matter
+                if self._poll(s, timeout):
+                    return _loads(s.recv())
+            except BaseException:
+                self.close()
+                raise
+            self.close()
+        raise TimeoutError(f"ZMQ Communication with {self.addrstr} timed out after {timeout}ms")
+
+
+class ZMQDEALERClient(JSONClientBase):
+    """
+    JSON RPC over a ZMQ Dealer socket
+
+    Each request is sent behind a correlation id, which a REP server echoes
+    back in the reply envelope, so calls from several threads can be in flight
+    at once. A background thread owns the dealer socket and hands each reply
+    to the caller waiting on its id.
     """
     def __init__(self, address, port, timeout=5000):
-        self.ctx = zmq.Context()
-        self.address = address
-        self.port = port
+        super().__init__(address, port)
+        self.ctx = zmq.Context.instance()
         self.addrstr = f"tcp://{address}:{port}"
         self.timeout = timeout
+        self._cid = itertools.count()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        inproc = f"inproc://rpc-dealer-{id(self)}"
+        pull = self.ctx.socket(zmq.PULL)
+        pull.bind(inproc)
+        self._push = self.ctx.socket(zmq.PUSH)
+        self._push.connect(inproc)
+        self._push_lock = threading.Lock()
+        threading.Thread(target=self._run, args=(pull,), daemon=True).start()
+
+    def _run(self, pull):
+        dealer = self.ctx.socket(zmq.DEALER)
+        dealer.setsockopt(zmq.LINGER, 0)
+        dealer.setsockopt(zmq.SNDHWM, 1000)
+        dealer.connect(self.addrstr)
+        poller = zmq.Poller()
+        poller.register(pull, zmq.POLLIN)
+        poller.register(dealer, zmq.POLLIN)
+        while True:
+            for sock, _ in poller.poll():
+                if sock is pull:
+                    cid, msg = pull.recv_multipart()
+                    dealer.send_multipart([cid, b"", msg])
+                else:
+                    cid, _, reply = dealer.recv_multipart()
+                    with self._pending_lock:
+                        waiter = self._pending.pop(cid, None)
+                    if waiter is not None:
+                        waiter[1] = reply
+                        waiter[0].set()
 
-    def sendrcv(self, method, *params, **kwargs):
+    def sendrcv(self, method, *params, extra_timeout=0, **kwargs):
         msg = self.formatMsg(method, *params, **kwargs)
-        s = self.ctx.socket(zmq.REQ)
+        timeout = self.timeout + extra_timeout * 1000
+        cid = str(next(self._cid)).encode()
+        waiter = [threading.Event(), None]
+        with self._pending_lock:
+            self._pending[cid] = waiter
+        with self._push_lock:
+            self._push.send_multipart([cid, msg])
+        if not waiter[0].wait(timeout / 1000):
+            with self._pending_lock:
+                self._pending.pop(cid, None)
+            raise TimeoutError(f"ZMQ Communication with {self.addrstr} timed out after {timeout}ms")
+        return _loads(waiter[1])
+
+
+class ZMQSubscriber:
+    """
+    Listens for JSON messages the server publishes as [topic, message] frames
+    on a ZMQ PUB socket, and hands each one to the callbacks for its topic
+    """
+    def __init__(self, address, port):
+        self.ctx = zmq.Context.instance()
+        self.address = address
+        self.port = port
+        self.addrstr = f"tcp://{address}:{port}"
+        self._callbacks = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def subscribe(self, topic, callback):
+        with self._lock:
+            self._callbacks.setdefault(topic, []).append(callback)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        s = self.ctx.socket(zmq.SUB)
         s.setsockopt(zmq.LINGER, 0)
+        s.setsockopt(zmq.SUBSCRIBE, b"")
         s.connect(self.addrstr)
-        s.send(msg)
-        # https://zguide.zeromq.org/docs/chapter4/
-        # Not implementing retries because it is unlikely to matter
-        if (s.poll(self.timeout) & zmq.POLLIN) != 0:
-            m = s.recv_json()
-            s.close()
-            return m
-        else:
-            s.close()
-            raise TimeoutError(f"ZMQ Communication with {self.addrstr} timed out after {self.timeout}ms")
+        # This thread is the only listener, so a bad message or a failing
+        # callback is logged and skipped rather than allowed to end it
+        while True:
+            frames = s.recv_multipart()
+            try:
+                topic, msg = frames
+                topic = topic.decode()
+                with self._lock:
+                    callbacks = list(self._callbacks.get(topic, []))
+                if not callbacks:
+                    continue
+                msg = _loads(msg)
+            except Exception:
+                logger.exception("Ignoring malformed message from %s", self.addrstr)
+                continue
+            for cb in callbacks:
+                try:
+                    cb(msg)
+                except Exception:
+                    logger.exception("Callback for %r from %s failed", topic, self.addrstr)
+
+
+class ZMQPusher:
+    """
+    Sends fire-and-forget JSON notifications to the server over a ZMQ PUSH
+    socket, for messages whose reply we don't need to wait for. If SNDHWM
+    messages are already queued because nothing is reading, further messages
+    are logged and dropped rather than blocking the sender.
+    """
+    def __init__(self, address, port):
+        self.ctx = zmq.Context.instance()
+        self.address = address
+        self.port = port
+        self.addrstr = f"tcp://{address}:{port}"
+        self._sock = self.ctx.socket(zmq.PUSH)
+        self._sock.setsockopt(zmq.LINGER, 0)
+        self._sock.setsockopt(zmq.SNDHWM, 1000)
+        self._sock.connect(self.addrstr)
+        self._lock = threading.Lock()
 
+    def push(self, msg):
+        """
+        Queue msg for the server, returning False if it had to be dropped
+        """
+        with self._lock:
+            try:
+                self._sock.send(_dumps(msg), zmq.NOBLOCK)
+            except zmq.Again:
+                logger.warning("Dropping message to %s, nothing is reading: %r", self.addrstr, msg)
+                return False
+        return True
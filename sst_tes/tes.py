@@ -5,35 +5,63 @@ from ophyd import (
     Kind,
     FormattedComponent as FCpt,
 )
-from ophyd.signal import AttributeSignal, Signal, EpicsSignal
+from ophyd.signal import AttributeSignal, EpicsSignal
 import time as ttime
 import threading
-from queue import Queue, Empty
-from collections import OrderedDict, deque
-import itertools
-from os.path import join, relpath
-from .tes_signals import *
+from .tes_signals import RPCBatchReadMixin
 from .rpc import RPCInterface, RPCException
+from ._spsc import SPSCRing
 from functools import wraps
+from contextlib import contextmanager
+from datetime import datetime
+from types import MappingProxyType
 
 
 class TESException(Exception):
     pass
 
 
+def _check(response):
+    # The server always sends a JSON bool, so an identity test is enough, and
+    # the error message is only built on failure
+    if response["success"] is False:
+        raise TESException("RPC failed with message " + str(response["response"]))
+    return response
+
+
 def raiseOnFailure(f):
+    @wraps(f)
     def _inner(*args, **kwargs):
-        response = f(*args, **kwargs)
-        if not response["success"]:
-            raise TESException(f"RPC failed with message {response['response']}")
-        return response
+        return _check(f(*args, **kwargs))
 
     return _inner
 
 
-class TESBase(Device, RPCInterface):
+class TESBase(RPCBatchReadMixin, Device, RPCInterface):
+    # Slots for the attributes used per point. The ophyd bases still give
+    # instances a __dict__, so this mainly makes lookups of these names cheaper.
+    # path (a property) and _cal_flag/_acquire_time (class defaults) are left out.
+    __slots__ = (
+        "_hints", "_log", "_completion_status", "_save_roi", "verbose",
+        "file_mode", "_rois", "_roi_batch", "_roi_keys", "_roi_describe",
+        "last_time", "_last_noise_file", "_last_projector_file", "_path",
+        "setFilenamePattern", "_path_cache", "scanexfiltrator", "_scan_started",
+        "_commStatus", "_connected", "_last_comm_check", "_last_comm_push",
+        "_scan_point_start", "_scan_point_end", "_pending_points",
+        "_server_timed_points", "_external_devices_cached", "_trigger_q",
+        "_trigger_thread", "_file_start_call", "_data_index",
+    )
     _cal_flag = False
     _acquire_time = 1
+    _comm_check_interval = 1.0
+    _comm_push_timeout = 5.0
+    # Seconds past acquire_time to wait for a server-timed point's point_end
+    _point_end_margin = 5.0
+    # Called at every point, so sent by numeric id where the server allows
+    _rpc_id_methods = (
+        "scan_point", "scan_point_start", "scan_point_end", "batch",
+        "roi_get_counts", "commCheck",
+    )
     """
     Caproto concept:
     We talk directly to TES Server
@@ -54,10 +82,12 @@ class TESBase(Device, RPCInterface):
     )
     projectors_loaded = Cpt(EpicsSignal, "PROJECTORS", kind=Kind.config)
     calibration_uid = Cpt(EpicsSignal, "CALIBRATION_UID", string=True, kind=Kind.config)
-    filename = Cpt(EpicsSignal, "FILENAME", string=True, kind=Kind.config)
-    state = Cpt(EpicsSignal, "STATE", string=True, kind=Kind.config)
-    scan_num = Cpt(EpicsSignal, "SCAN_NUM", kind=Kind.config)
-    scan_str = Cpt(EpicsSignal, "SCAN_STR", string=True, kind=Kind.config)
+    # Read at every read_configuration, so keep them updated by CA monitors
+    # rather than fetching each one on demand
+    filename = Cpt(EpicsSignal, "FILENAME", string=True, kind=Kind.config, auto_monitor=True)
+    state = Cpt(EpicsSignal, "STATE", string=True, kind=Kind.config, auto_monitor=True)
+    scan_num = Cpt(EpicsSignal, "SCAN_NUM", kind=Kind.config, auto_monitor=True)
+    scan_str = Cpt(EpicsSignal, "SCAN_STR", string=True, kind=Kind.config, auto_monitor=True)
     scan_point_start = FCpt(
         AttributeSignal, "_scan_point_start", kind=Kind.normal, add_prefix=()
     )
@@ -77,28 +107,69 @@ class TESBase(Device, RPCInterface):
         verbose=False,
         path=None,
         setFilenamePattern=False,
+        server_timed_points=False,
         **kwargs,
     ):
         super().__init__(prefix, name=name, **kwargs)
+        if server_timed_points and self.rpc_sub is None:
+            raise ValueError("server_timed_points needs a sub_port to hear point_end on")
         self._hints = {"fields": [f"{name}_tfy"]}
         self._log = {}
         self._completion_status = None
         self._save_roi = False
         self.verbose = verbose
         self.file_mode = "continuous"  # Or "start_stop"
+        self._roi_batch = None
         self.rois = {"tfy": (0, 1200)}
         self.last_time = 0
         self._last_noise_file = None
         self._last_projector_file = None
         self.path = path
         self.setFilenamePattern = setFilenamePattern
+        self._path_cache = (None, None, None)
+        self._file_start_call = self.rpc.partial("file_start", setFilenamePattern=False)
+        self.rpc.register_methods(self._rpc_id_methods)
         self.scanexfiltrator = None
+        self._scan_started = False
         self._commStatus = "Disconnected"
         self._connected = False
+        self._last_comm_check = None
+        self._last_comm_push = None
         self._scan_point_start = 0
         self._scan_point_end = 0
+        self._pending_points = {}
+        self._server_timed_points = server_timed_points
+        # The component tree is fixed once the device exists, so find the
+        # children that produce asset documents once instead of at every stage
+        self._external_devices_cached = [
+            dev for _, dev in self._get_components_of_kind(Kind.normal)
+            if hasattr(dev, "collect_asset_docs")
+        ]
+        if self.rpc_sub is not None:
+            self.rpc_sub.subscribe("commStatus", self._on_comm_status)
+            if server_timed_points:
+                self.rpc_sub.subscribe("point_end", self._on_point_end)
+        # Created by the first trigger that needs it
+        self._trigger_q = None
+        self._trigger_thread = None
+
+    def _on_comm_status(self, msg):
+        self._connected = msg["success"]
+        self._commStatus = msg["response"]
+        self._last_comm_push = ttime.monotonic()
 
     def _commCheck(self):
+        """
+        Update the connection status. A server that publishes commStatus keeps
+        it current by itself; otherwise, or if its messages stop arriving, the
+        server is polled with commCheck.
+        """
+        now = ttime.monotonic()
+        if self._last_comm_push is not None and now - self._last_comm_push < self._comm_push_timeout:
+            return
+        if self._last_comm_check is not None and now - self._last_comm_check < self._comm_check_interval:
+            return
+        self._last_comm_check = now
         try:
             msg = self.rpc.commCheck()
         except RPCException:
@@ -106,61 +177,57 @@ class TESBase(Device, RPCInterface):
         self._connected = msg["success"]
         self._commStatus = msg["response"]
 
-    @raiseOnFailure
-    def _file_start(self, path=None, force=False):
+    def _file_start(self, path=None, force=False, state=None):
         """
         Starts file writing. If self.setFilenamePattern,
         path should be something that can be formatted by datetime.strftime,
         i.e., /nsls2/data/sst1/legacy/ucal/raw/%Y/%m/%d
         This should certainly be the default, and file_start should not generally be called
-        with arguments
+        with arguments. A state the caller has just read may be passed in to
+        avoid reading it again.
         """
 
-        if path is None:
-            path = self.path
-        if self.state.get() == "no_file" or force:
-            msg = self.rpc.file_start(
-                path,
-                setFilenamePattern=self.setFilenamePattern,
-            )
-            return msg
+        if state is None:
+            state = self.state.get()
+        if state == "no_file" or force:
+            msg = self._file_start_call(self._server_path(path))
+            return _check(msg)
         else:
             print("TES already has file open, not forcing!")
             return {"success": True, "response": "File already open"}
 
-    @raiseOnFailure
     def _file_end(self):
-        return self.rpc.file_end()
+        msg = self.rpc.file_end()
+        return _check(msg)
 
-    @raiseOnFailure
-    def _calibration_start(self):
+    def _get_scaninfo(self):
         if self.scanexfiltrator is not None:
-            scaninfo = self.scanexfiltrator.get_scan_start_info()
-        else:
-            scaninfo = {}
-        var_name = scaninfo.get("motor", "unnamed_motor")
-        var_unit = scaninfo.get("motor_unit", "index")
-        scan_num = self.scan_num.get()
-        sample_id = scaninfo.get("sample_id", -1)
-        sample_name = scaninfo.get("sample_name", "null")
-        # start_energy = scaninfo.get("start_energy", -1)
-        routine = "simulated_source"
+            return self.scanexfiltrator.get_scan_start_info()
+        return {}
+
+    def _scan_info_common(self):
+        """
+        Return (var_name, var_unit, sample_id, sample_name, start_energy) for
+        the scan being started, with defaults for anything not provided
+        """
+        scaninfo = self._get_scaninfo()
+        return (
+            scaninfo.get("motor", "unnamed_motor"),
+            scaninfo.get("motor_unit", "index"),
+            scaninfo.get("sample_id", -1),
+            scaninfo.get("sample_name", "null"),
+            scaninfo.get("start_energy", -1),
+        )
+
+    def _calibration_start(self):
+        var_name, var_unit, sample_id, sample_name, _ = self._scan_info_common()
         if self.verbose:
-            print(f"start calibration scan {scan_num}")
-        return self.rpc.calibration_start(var_name, var_unit, sample_id, sample_name)
+            print(f"start calibration scan {self.scan_num.get()}")
+        msg = self.rpc.calibration_start(var_name, var_unit, sample_id, sample_name)
+        return _check(msg)
 
-    @raiseOnFailure
     def _scan_start(self):
-        if self.scanexfiltrator is not None:
-            scaninfo = self.scanexfiltrator.get_scan_start_info()
-        else:
-            scaninfo = {}
-        var_name = scaninfo.get("motor", "unnamed_motor")
-        var_unit = scaninfo.get("motor_unit", "index")
-        sample_id = scaninfo.get("sample_id", -1)
-        sample_name = scaninfo.get("sample_name", "null")
-        start_energy = scaninfo.get("start_energy", -1)
-
+        var_name, var_unit, sample_id, sample_name, start_energy = self._scan_info_common()
         msg = self.rpc.scan_start(
             var_name,
             var_unit,
@@ -168,14 +235,94 @@ class TESBase(Device, RPCInterface):
             sample_name,
             extra={"start_energy": start_energy},
         )
-        return msg
+        return _check(msg)
 
-    @raiseOnFailure
     def _scan_end(self):
         msg = self.rpc.scan_end(_try_post_processing=False)
         self.scanexfiltrator = None
+        self._scan_started = False
+        return _check(msg)
+
+    def _begin_scan(self):
+        """
+        Open a file if none is open and start a scan (or calibration scan if
+        cal_flag is set) with a single begin_scan RPC, which replies with the
+        new state, filename and scan_num. Servers without begin_scan get the
+        separate state/file_start/scan_start calls instead.
+        """
+        # Point indices restart at 0 every scan, so a late point_end from an
+        # earlier, aborted scan must not be able to finish one of ours
+        self._pending_points.clear()
+        cal_flag = self.cal_flag.get()
+        msg = self.rpc.call_if_supported(
+            "begin_scan",
+            self._server_path(),
+            self._get_scaninfo(),
+            calibration=cal_flag,
+            setFilenamePattern=False,
+        )
+        if msg is None:
+            state = self.state.get()
+            if self.file_mode == "start_stop" or state == "no_file":
+                self._file_start(state=state)
+            if cal_flag:
+                msg = self._calibration_start()
+            else:
+                msg = self._scan_start()
+        else:
+            _check(msg)
+        self._scan_started = True
         return msg
 
+    def _finish_scan(self):
+        """
+        End the scan started by _begin_scan, and its file in start_stop mode.
+        Nothing is sent if no scan was started, e.g. because stage failed early.
+        """
+        self._pending_points.clear()
+        if not self._scan_started:
+            self.scanexfiltrator = None
+            return
+        if self.file_mode != "start_stop":
+            self._scan_end()
+            return
+        # End the scan and close its file in one request where supported
+        self.scanexfiltrator = None
+        self._scan_started = False
+        batch = self.rpc.batch()
+        batch.add("scan_end", _try_post_processing=False)
+        batch.add("file_end")
+        responses = batch.submit()
+        if responses is None:
+            self._scan_end()
+            self._file_end()
+            return
+        for msg in responses:
+            _check(msg)
+
+    def _server_path(self, path=None):
+        """
+        Return path (self.path by default) as it should be sent to the server.
+        With setFilenamePattern it is a strftime pattern, which is formatted
+        here so that every file lands in the directory for the client's time;
+        either way the server is told setFilenamePattern=False.
+        """
+        if path is None:
+            path = self.path
+        if self.setFilenamePattern:
+            return self._format_path(path)
+        return path
+
+    def _format_path(self, pattern):
+        """
+        Format pattern with strftime, reusing the result while the wall-clock
+        second it was formatted in lasts
+        """
+        bucket = int(ttime.time())
+        if self._path_cache[:2] != (bucket, pattern):
+            self._path_cache = (bucket, pattern, datetime.now().strftime(pattern))
+        return self._path_cache[2]
+
     @property
     def path(self):
         if hasattr(self, "_dynamic_path"):
@@ -188,100 +335,296 @@ class TESBase(Device, RPCInterface):
     def path(self, path):
         self._path = path
         
-    def _acquire(self, status, i):
-        # t1 = ttime.time()
-        # t2 = t1 + self.acquire_time.get()
+    def _scan_point_val(self, i):
         if self.scanexfiltrator is not None:
-            val = self.scanexfiltrator.get_scan_point_info()
+            return self.scanexfiltrator.get_scan_point_info()
         else:
-            val = i
+            return i
 
-        start_time = self.rpc.scan_point_start(val)["response"]
-        self._scan_point_start = float(start_time)
-        self.last_time = float(start_time)
-        ttime.sleep(self.acquire_time.get())
-        msg = self.rpc.scan_point_end()
+    def _acquire(self, status, i):
+        """
+        Acquire one point of acquire_time seconds. Servers with scan_point
+        start, wait and end the point themselves and reply with both
+        timestamps. That call, like the batch used as a fallback, stays open
+        for the whole exposure: it holds the client's lock and keeps a
+        single-threaded server busy until the point ends, so its reply
+        timeout is extended by the exposure.
+        """
+        val = self._scan_point_val(i)
+        exposure = self._acquire_time
+        msg = self.rpc.call_if_supported("scan_point", val, exposure, extra_timeout=exposure)
+        if msg is not None:
+            _check(msg)
+            start_time = float(msg["response"]["start"])
+            self._set_attribute(self.scan_point_start, "_scan_point_start", start_time)
+            self.last_time = start_time
+            self._set_attribute(self.scan_point_end, "_scan_point_end", float(msg["response"]["end"]))
+            status.set_finished()
+            return msg
+        # Otherwise send start, wait and end as one batch, where supported
+        batch = self.rpc.batch()
+        batch.add("scan_point_start", val)
+        batch.add("sleep", exposure)
+        batch.add("scan_point_end")
+        responses = batch.submit()
+        if responses is None:
+            start_time = float(self.rpc.scan_point_start(val)["response"])
+            self._set_attribute(self.scan_point_start, "_scan_point_start", start_time)
+            self.last_time = start_time
+            ttime.sleep(exposure)
+            msg = self.rpc.scan_point_end()
+        else:
+            for msg in responses:
+                _check(msg)
+            start_time = float(responses[0]["response"])
+            self._set_attribute(self.scan_point_start, "_scan_point_start", start_time)
+            self.last_time = start_time
+            msg = responses[-1]
         end_time = float(msg["response"])
-        self._scan_point_end = end_time
-        # self.last_time = ttime.time()
+        self._set_attribute(self.scan_point_end, "_scan_point_end", end_time)
         status.set_finished()
         return msg
 
-    @raiseOnFailure
-    def take_noise(self, path=None):
-        self._set_noise_triggers()
-        self.set_exposure(1.0)
-        if path is None:
-            path = self.path
-        start_msg = self.rpc.file_start(
-            path,
+    def _start_trigger_worker(self):
+        q = self._trigger_q = SPSCRing()
+        self._trigger_thread = threading.Thread(
+            target=self._trigger_worker, args=(q,), daemon=True
+        )
+        self._trigger_thread.start()
+        return q
+
+    def _trigger_worker(self, q):
+        """
+        Runs the acquisitions queued by trigger, one at a time, so that a
+        trigger doesn't have to start a thread of its own. A None item, queued
+        by destroy, ends the worker once the points ahead of it have run.
+        """
+        while True:
+            item = q.pop()
+            if item is None:
+                break
+            target, status, i = item
+            try:
+                target(status, i)
+            except Exception as e:
+                if not status.done:
+                    status.set_exception(e)
+
+    def _acquire_pushed(self, status, i):
+        """
+        Acquire a point, announcing its start and end to the server over the
+        push channel instead of waiting on scan_point_start/scan_point_end
+        replies. Timestamps are taken locally.
+        """
+        val = self._scan_point_val(i)
+        start_time = ttime.time()
+        self.rpc_push.push({"cmd": "point_start", "i": i, "val": val, "t": start_time})
+        self._set_attribute(self.scan_point_start, "_scan_point_start", start_time)
+        self.last_time = start_time
+        ttime.sleep(self._acquire_time)
+        end_time = ttime.time()
+        self.rpc_push.push({"cmd": "point_end", "i": i, "t": end_time})
+        self._set_attribute(self.scan_point_end, "_scan_point_end", end_time)
+        status.set_finished()
+
+    def _acquire_published(self, status, i):
+        """
+        Start a point that the server ends by itself after acquire_time,
+        announcing the end on its publish socket (see _on_point_end). Used
+        when the device is created with server_timed_points=True.
+        """
+        self._pending_points[i] = status
+        val = self._scan_point_val(i)
+        msg = self.rpc.scan_point_start(val, point=i, duration=self._acquire_time)
+        if not msg["success"]:
+            self._pending_points.pop(i, None)
+            status.set_exception(TESException(f"RPC failed with message {msg['response']}"))
+            return msg
+        start_time = float(msg["response"])
+        self._set_attribute(self.scan_point_start, "_scan_point_start", start_time)
+        self.last_time = start_time
+        return msg
+
+    def _on_point_end(self, msg):
+        status = self._pending_points.pop(msg["point"], None)
+        # The point may already have timed out
+        if status is not None and not status.done:
+            self._set_attribute(self.scan_point_end, "_scan_point_end", float(msg["t_end"]))
+            status.set_finished()
+
+    def _start_ljh_file(self, atomic_method, trigger_method, path=None):
+        """
+        Switch the trigger mode and start an LJH-only file. Servers that have
+        atomic_method do both in one call; otherwise they are sent as one batch
+        request where the server supports it.
+        """
+        path = self._server_path(path)
+        file_kwargs = dict(
             write_ljh=True,
             write_off=False,
-            setFilenamePattern=self.setFilenamePattern,
+            setFilenamePattern=False,
         )
+        msg = self.rpc.call_if_supported(atomic_method, path, **file_kwargs)
+        if msg is not None:
+            return _check(msg)
+        batch = self.rpc.batch()
+        batch.add(trigger_method)
+        batch.add("file_start", path, **file_kwargs)
+        responses = batch.submit()
+        if responses is None:
+            _check(self.rpc.sendrcv(trigger_method))
+            responses = [self.rpc.file_start(path, **file_kwargs)]
+        for msg in responses:
+            _check(msg)
+        return msg
+
+    def take_noise(self, path=None):
+        self.set_exposure(1.0)
+        start_msg = self._start_ljh_file("take_noise_atomic", "set_noise_triggers", path)
         noise_file = start_msg["response"]
         self.noise_filename.set(noise_file).wait()
         self._last_noise_file = noise_file
         return start_msg
 
-    @raiseOnFailure
     def _set_pulse_triggers(self):
         msg = self.rpc.set_pulse_triggers()
-        return msg
+        return _check(msg)
 
-    @raiseOnFailure
     def _set_noise_triggers(self):
         msg = self.rpc.set_noise_triggers()
-        return msg
+        return _check(msg)
 
-    @raiseOnFailure
     def take_projectors(self, path=None):
-        self._set_pulse_triggers()
         self.set_exposure(1.0)
-        if path is None:
-            path = self.path
-        start_msg = self.rpc.file_start(
-            path,
-            write_ljh=True,
-            write_off=False,
-            setFilenamePattern=self.setFilenamePattern,
-        )
+        start_msg = self._start_ljh_file("take_projectors_atomic", "set_pulse_triggers", path)
         projector_file = start_msg["response"]
         self.projector_filename.set(projector_file).wait()
         self._last_projector_file = projector_file
         return start_msg
 
-    @raiseOnFailure
     def make_projectors(self):
         noise_file = self.noise_filename.get()
         projector_file = self.projector_filename.get()
         msg = self.rpc.make_projectors(noise_file, projector_file)
-        return msg
+        return _check(msg)
 
-    @raiseOnFailure
     def set_projectors(self):
         msg = self.rpc.set_projectors()
-        return msg
+        return _check(msg)
+
+    @property
+    def rois(self):
+        """
+        The ROIs as {label: (llim, ulim)}. This is a read-only view; use
+        set_roi/clear_roi, or assign a new dict, so the data keys stay in step
+        """
+        return MappingProxyType(self._rois)
+
+    @rois.setter
+    def rois(self, rois):
+        self._rois = dict(rois)
+        self._update_roi_keys()
+
+    def _update_roi_keys(self):
+        """
+        Rebuild the data keys and describe entries for the current ROIs, so that
+        describe/read don't have to recompute them at every point
+        """
+        self._roi_keys = {k: f"{self.name}_{k}" for k in self._rois}
+        self._roi_describe = {
+            key: {"dtype": "number", "shape": [], "source": key,
+                  "llim": self._rois[k][0], "ulim": self._rois[k][1]}
+            for k, key in self._roi_keys.items()
+        }
+
+    def _roi_set(self, rois):
+        if self._roi_batch is not None:
+            self._roi_batch.update(rois)
+            return None
+        return self.rpc.roi_set(rois)
+
+    @contextmanager
+    def rois_batch(self):
+        """
+        Collect the set_roi/clear_roi calls made inside the block and send them
+        to the server as a single roi_set when it exits
+        """
+        if self._roi_batch is not None:
+            yield
+            return
+        self._roi_batch = {}
+        try:
+            yield
+        finally:
+            rois, self._roi_batch = self._roi_batch, None
+            if rois:
+                self.rpc.roi_set(rois)
 
     def set_roi(self, label, llim, ulim):
-        self.rois[label] = (llim, ulim)
-        return self.rpc.roi_set({label: (llim, ulim)})
+        self._rois[label] = (llim, ulim)
+        self._update_roi_keys()
+        return self._roi_set({label: (llim, ulim)})
 
     def clear_roi(self, label):
-        self.rois.pop(label)
-        return self.rpc.roi_set({label: (None, None)})
+        self._rois.pop(label)
+        self._update_roi_keys()
+        return self._roi_set({label: (None, None)})
 
     def trigger(self):
         if self.verbose:
             print("Triggering TES")
-        status = DeviceStatus(self)
+        # Statuses are not pooled: the RunEngine and any subscribers keep hold of the
+        # status and may still read it after the point, and a finished
+        # DeviceStatus cannot be reset
         i = next(self._data_index)
-        threading.Thread(target=self._acquire, args=(status, i), daemon=True).start()
+        if self._server_timed_points:
+            # Only a published point_end finishes these points, and PUB/SUB
+            # can lose it, so give up on a point that overruns by too much
+            status = DeviceStatus(self, timeout=self._acquire_time + self._point_end_margin)
+            self._acquire_published(status, i)
+        else:
+            status = DeviceStatus(self)
+            if self.rpc_push is not None:
+                target = self._acquire_pushed
+            else:
+                target = self._acquire
+            q = self._trigger_q
+            if q is None:
+                q = self._start_trigger_worker()
+            if not q.try_push((target, status, i)):
+                raise RuntimeError(f"{self.name} has too many triggers in flight")
         return status
 
+    def destroy(self):
+        """
+        Stop the trigger worker, after any points already queued, and release
+        its ring
+        """
+        q, self._trigger_q = self._trigger_q, None
+        if q is not None:
+            while not q.try_push(None):
+                ttime.sleep(0.01)
+            self._trigger_thread.join()
+            self._trigger_thread = None
+            q.close()
+        super().destroy()
+
     def stop(self):
-        if self._completion_status is not None:
-            self._completion_status.set_finished()
+        # The status is kept, since flyers still read it after a stop, but a
+        # second stop must not finish it again
+        status = self._completion_status
+        if status is not None and not status.done:
+            status.set_finished()
+
+    def _set_attribute(self, signal, attr, value):
+        """
+        Set the attribute behind an AttributeSignal, going through the signal
+        only when something is subscribed to it
+        """
+        if signal._callbacks[signal.SUB_VALUE]:
+            signal.put(value)
+        else:
+            setattr(self, attr, value)
 
     def set_exposure(self, exp_time):
-        self.acquire_time.put(exp_time)
+        self._set_attribute(self.acquire_time, "_acquire_time", exp_time)
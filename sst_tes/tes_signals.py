@@ -1,23 +1,58 @@
+from ophyd import Kind
 from ophyd.signal import Signal
 from ophyd.utils.epics_pvs import data_type, data_shape
 from .rpc import RPCInterface
 import time as ttime
 
 class RPCSignalPair(Signal, RPCInterface):
-    def __init__(self, *args, get_method, set_method, get_args=[], set_args=[],**kwargs):
+    def __init__(self, *args, get_method, set_method, get_args=[], set_args=[], ttl=0, **kwargs):
         """
         A signal to define an RPC get/set pair
+
+        Values read within ttl seconds of each other are served from the
+        previous reply instead of a new round trip
         """
         super().__init__(*args, **kwargs)
         self.rpc_get = get_method
         self.rpc_set = set_method
         self.get_args = get_args
         self.set_args = set_args
+        self.ttl = ttl
+        self._ttl_value = None
+        self._ttl_time = None
+
+    def invalidate(self):
+        """
+        Forget cached values, both this signal's own and the parent's get_many
+        batch that would otherwise still be served after a set
+        """
+        self._ttl_time = None
+        if getattr(self.parent, "_status_cache", None) is not None:
+            self.parent._status_cache = None
         
+    def _get_batched(self):
+        """
+        Look for this signal's value in the parent's most recent get_many batch
+        """
+        cache = getattr(self.parent, "_status_cache", None)
+        if cache is None or self.get_args:
+            return None
+        t, values = cache
+        if ttime.monotonic() - t > self.parent._status_cache_ttl:
+            return None
+        return values.get(self.rpc_get)
+
     def get(self, **kwargs):
+        value = self._get_batched()
+        if value is not None:
+            return value
+        if self._ttl_time is not None and ttime.monotonic() - self._ttl_time < self.ttl:
+            return self._ttl_value
         r = self.rpc.sendrcv(self.rpc_get, *self.get_args)
         response = r['response']
         success = r['success']
+        self._ttl_value = response
+        self._ttl_time = ttime.monotonic()
         return response
 
     def put(self, value, **kwargs):
@@ -25,6 +60,7 @@ class RPCSignalPair(Signal, RPCInterface):
             raise ReadOnlyError("RPCSignal is marked as read-only")
         old_value = self.get()
         _ = self.rpc.sendrcv(self.rpc_set, value, *self.set_args)
+        self.invalidate()
         self._run_subs(sub_type=self.SUB_VALUE, old_value=old_value,
                        value=value, timestamp=ttime.time())
 
@@ -59,10 +95,11 @@ class RPCSignal(RPCSignalPair):
         
 class RPCSignalRO(RPCSignal):
     """
-    Convenience class for read-only signals
+    Convenience class for read-only signals. Reads are cached for 50 ms by
+    default, since ophyd tends to ask for the same value several times in a row
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, *args, ttl=0.05, **kwargs):
+        super().__init__(*args, ttl=ttl, **kwargs)
         self._metadata.update(write_access=False)
 
     def put(self, value, **kwargs):
@@ -71,6 +108,44 @@ class RPCSignalRO(RPCSignal):
     def set(self, value, **kwargs):
         raise ReadOnlyError("The signal {} is readonly".format(self.name))
 
+class RPCBatchReadMixin:
+    """
+    Mixin for Devices with several RPCSignal components. Before a read, the
+    argument-free RPC signals of the relevant kind are fetched with a single
+    get_many call, and each signal answers from that batch instead of making
+    its own round trip. Servers without get_many fall back to per-signal calls.
+    """
+    _status_cache = None
+    _status_cache_ttl = 0.05
+    _batch_methods = None
+
+    def _get_batch_methods(self, kind):
+        if self._batch_methods is None:
+            self._batch_methods = {}
+        if kind not in self._batch_methods:
+            self._batch_methods[kind] = [
+                sig.rpc_get for _, sig in self._get_components_of_kind(kind)
+                if isinstance(sig, RPCSignalPair) and not sig.get_args
+            ]
+        return self._batch_methods[kind]
+
+    def _prefetch_status(self, kind):
+        methods = self._get_batch_methods(kind)
+        if not methods:
+            return
+        msg = self.rpc.call_if_supported("get_many", methods)
+        if msg is not None and msg["success"]:
+            self._status_cache = (ttime.monotonic(), msg["response"])
+
+    def read_configuration(self):
+        self._prefetch_status(Kind.config)
+        return super().read_configuration()
+
+    def read(self):
+        self._prefetch_status(Kind.normal)
+        return super().read()
+
+
 class ExternalFileReference(Signal):
     """
     A pure software signal where a Device can stash a datum_id